@@ -7,9 +7,13 @@ Manage Dell DRAC.
 
 # Import python libs
 from __future__ import absolute_import
+import itertools
 import logging
 import os
 import re
+import sys
+import threading
+import time
 
 # Import Salt libs
 from salt.exceptions import CommandExecutionError
@@ -18,12 +22,83 @@ import salt.utils
 # Import 3rd-party libs
 import salt.ext.six as six
 from salt.ext.six.moves import range  # pylint: disable=import-error,no-name-in-module,redefined-builtin
-from salt.ext.six.moves import map
+
+try:
+    import pexpect
+    HAS_PEXPECT = True
+except ImportError:
+    HAS_PEXPECT = False
 
 log = logging.getLogger(__name__)
 
 __proxyenabled__ = ['fx2']
 
+# Memoized location of the racadm binary; resolved once in __virtual__
+# instead of walking PATH on every loader pass, and reused as argv[0]
+# by the command builders
+_racadm_path = None
+
+# Memoized list_users results, keyed on (host, admin_username, module).
+# Enumerating users costs 16 racadm round-trips, so back-to-back lookups
+# within _USERS_CACHE_TTL seconds reuse one enumeration.
+_users_cache = {}
+_USERS_CACHE_TTL = 30
+
+# (host, admin_username) pairs whose firmware rejects the aggregate
+# cfgUserAdmin getconfig form; list_users skips the probe for them
+_users_aggregate_unsupported = set()
+
+# Memoized list_slotnames results, keyed on (host, admin_username), so
+# per-slot accessors like get_slotname don't re-enumerate the chassis
+_slotnames_cache = {}
+_SLOTNAMES_CACHE_TTL = 30
+
+# Memoized system_info results, keyed on (host, admin_username), so a
+# batch of single-value accessors shares one getsysinfo round-trip
+_sysinfo_cache = {}
+_SYSINFO_CACHE_TTL = 30
+
+# Noise lines stripped from racadm output before parsing.  A tuple
+# argument lets str.startswith check every prefix in one C-level call.
+_SKIP_PREFIXES = ('Security Alert', 'Continuing execution')
+# racadm messages that mark the end of useful output
+_STOP_PREFIXES = ('RAC1168:', 'RAC1169:')
+
+# 'slot [slotname [hostname]]' rows in getslotname output
+_SLOT_RE = re.compile(r'^\s*(\S+)(?:\s+(\S+))?(?:\s+(\S+))?\s*$')
+
+# getversion section tags and the column names of each section's rows
+_INVENTORY_SECTIONS = {'<Server>': 'server',
+                       '<Switch>': 'switch',
+                       '<CMC>': 'cmc',
+                       '<Chassis Infrastructure>': 'chassis'}
+_INVENTORY_FIELDS = {'server': ('name', 'idrac_version', 'blade_type',
+                                'gen', 'updateable'),
+                     'switch': ('name', 'model_name', 'hw_version',
+                                'fw_version'),
+                     'cmc': ('name', 'cmc_version', 'updateable'),
+                     'chassis': ('name', 'fw_version', 'fqdd')}
+
+# Pooled SSH sessions to remote DRACs, keyed on (host, admin_username).
+# Reusing one authenticated session amortizes the connection handshake
+# that racadm -r otherwise pays on every single command.
+_SSH_SESSIONS = {}
+_SSH_SESSIONS_LOCK = threading.Lock()
+_SSH_PROMPT_RE = r'[>$#] ?$'
+# Monotonic sequence making each command's output sentinel unique
+_SSH_SENTINEL_SEQ = itertools.count()
+
+# cfgUserAdminPrivilege bit values by privilege name
+_PRIVILEGES = {'login': 0x0000001,
+               'drac': 0x0000002,
+               'user_management': 0x0000004,
+               'clear_logs': 0x0000008,
+               'server_control_commands': 0x0000010,
+               'console_redirection': 0x0000020,
+               'virtual_media': 0x0000040,
+               'test_alerts': 0x0000080,
+               'debug_commands': 0x0000100}
+
 try:
     run_all = __salt__['cmd.run_all']
 except (NameError, KeyError):
@@ -33,8 +108,293 @@ except (NameError, KeyError):
     }
 
 
+def _iter_lines(output):
+    '''
+    Yield the lines of ``output`` one at a time instead of
+    materializing them all up front the way str.splitlines does
+    '''
+    pos = 0
+    end = len(output)
+    while pos < end:
+        nl = output.find('\n', pos)
+        if nl == -1:
+            nl = end
+        line = output[pos:nl]
+        if line.endswith('\r'):
+            line = line[:-1]
+        yield line
+        pos = nl + 1
+
+
+def _split_fields(line):
+    '''
+    Split a getversion row on runs of two or more spaces in a single
+    scan, trimming the trailing whitespace as it goes.  Single spaces
+    stay inside a field so multi-word values like model names survive.
+    '''
+    fields = []
+    pos = 0
+    end = len(line)
+    find = line.find
+    while pos < end:
+        cut = find('  ', pos)
+        if cut == -1:
+            fields.append(line[pos:].rstrip())
+            break
+        fields.append(line[pos:cut])
+        pos = cut + 2
+        while pos < end and line[pos] == ' ':
+            pos += 1
+    return fields
+
+
+def _parallel_map(func, items, max_workers=8):
+    '''
+    Apply ``func`` to every item using a small pool of daemon threads
+    and return the results in item order
+
+    racadm calls against remote DRACs are network-bound, so issuing
+    them concurrently cuts the wall-clock time roughly by the worker
+    count.  The first exception raised by ``func`` is re-raised in the
+    calling thread.
+    '''
+    results = [None] * len(items)
+    errors = []
+    lock = threading.Lock()
+    counter = [0]
+
+    def _worker():
+        while True:
+            with lock:
+                if errors or counter[0] >= len(items):
+                    return
+                pos = counter[0]
+                counter[0] += 1
+            try:
+                results[pos] = func(items[pos])
+            except Exception:  # pylint: disable=broad-except
+                with lock:
+                    errors.append(sys.exc_info())
+                return
+
+    threads = []
+    for _ in range(min(max_workers, len(items))):
+        thread = threading.Thread(target=_worker)
+        thread.daemon = True
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        six.reraise(*errors[0])
+
+    return results
+
+
+def _ssh_sessions_enabled():
+    '''
+    Pooled SSH sessions are opt-in: they need pexpect installed and
+    ``dracr.ssh_session: True`` in the minion config
+    '''
+    if not HAS_PEXPECT:
+        return False
+    try:
+        return __opts__.get('dracr.ssh_session', False)
+    except NameError:
+        return False
+
+
+def _get_ssh_session(host, admin_username, admin_password):
+    '''
+    Lease a live SSH session to ``host``, creating and authenticating
+    one if needed.  The session stays out of the pool until the caller
+    hands it back through _release_ssh_session, so concurrent callers
+    never interleave commands on one channel.  Returns None when no
+    session can be established.
+    '''
+    key = (host, admin_username)
+    with _SSH_SESSIONS_LOCK:
+        session = _SSH_SESSIONS.pop(key, None)
+    if session is not None:
+        if session.isalive():
+            return session
+        session.close(force=True)
+
+    try:
+        session = pexpect.spawn(
+            'ssh -o StrictHostKeyChecking=no '
+            '-o NumberOfPasswordPrompts=1 {0}@{1}'.format(admin_username,
+                                                          host),
+            timeout=30)
+        if session.expect(['[Pp]assword:', _SSH_PROMPT_RE]) == 0:
+            session.sendline(admin_password)
+            session.expect(_SSH_PROMPT_RE)
+    except Exception:  # pylint: disable=broad-except
+        log.debug('unable to establish SSH session to {0}'.format(host),
+                  exc_info=True)
+        return None
+
+    return session
+
+
+def _release_ssh_session(host, admin_username, session):
+    '''
+    Hand a leased session back to the pool.  The pool keeps one
+    session per (host, user); when concurrent leases each spawned one,
+    the extra is closed instead of silently overwriting (and leaking)
+    the pooled one.
+    '''
+    key = (host, admin_username)
+    with _SSH_SESSIONS_LOCK:
+        if key in _SSH_SESSIONS:
+            extra = session
+        else:
+            _SSH_SESSIONS[key] = session
+            extra = None
+    if extra is not None:
+        extra.close(force=True)
+
+
+def _strip_echo(output, sent):
+    '''
+    Remove the remote pty's echo of the ``sent`` command line from the
+    start of ``output``.  The pty wraps long commands at its width, so
+    the echo can span several lines; walk the echoed text character by
+    character, skipping inserted line breaks, instead of dropping a
+    fixed number of lines.
+    '''
+    pos = 0
+    end = len(output)
+    for char in sent:
+        while pos < end and output[pos] in '\r\n':
+            pos += 1
+        if pos < end and output[pos] == char:
+            pos += 1
+        else:
+            # No echo present (or it doesn't match what was sent);
+            # leave the output untouched rather than guess
+            return output
+    if output[pos:pos + 2] == '\r\n':
+        pos += 2
+    elif output[pos:pos + 1] == '\n':
+        pos += 1
+    return output[pos:]
+
+
+def _execute_over_ssh(command, host, admin_username, admin_password):
+    '''
+    Run a racadm command through the pooled SSH session for ``host``
+    and return a cmd.run_all style dict, or None when the session path
+    is unavailable so the caller can fall back to one-shot racadm -r.
+    '''
+    session = _get_ssh_session(host, admin_username, admin_password)
+    if session is None:
+        return None
+
+    # racadm output lines can end in prompt-like characters (the
+    # <Server> tags in getversion, for one), so waiting for the shell
+    # prompt risks matching mid-output and leaving the rest buffered
+    # for the next command.  Echo a unique sentinel after the command
+    # and wait for that instead; the quote split keeps the echoed
+    # command line from containing the sentinel, so only the copy
+    # printed by echo can match.
+    sentinel = '__DRACR_DONE_{0}_{1}__'.format(os.getpid(),
+                                               next(_SSH_SENTINEL_SEQ))
+    sent = "racadm {0}; echo '{1}''{2}'".format(command,
+                                                sentinel[:9],
+                                                sentinel[9:])
+    try:
+        session.sendline(sent)
+        session.expect_exact(sentinel)
+        output = session.before
+        # Consume the prompt following the sentinel line so the
+        # channel is clean before the session goes back to the pool
+        session.expect(_SSH_PROMPT_RE)
+    except Exception:  # pylint: disable=broad-except
+        log.debug('SSH session to {0} failed, falling back to '
+                  'one-shot racadm'.format(host), exc_info=True)
+        # The lease means the session is already out of the pool;
+        # just close it
+        session.close(force=True)
+        return None
+
+    _release_ssh_session(host, admin_username, session)
+
+    if isinstance(output, six.binary_type):
+        output = output.decode('utf-8', 'replace')
+    # Drop the echoed command line, which can wrap across several
+    # pty rows for long commands
+    output = _strip_echo(output, sent)
+    output = '\n'.join(output.splitlines())
+
+    # The remote shell gives no exit status, so treat racadm error
+    # banners as a failed command
+    retcode = 1 if output.lstrip().startswith('ERROR') else 0
+    return {'retcode': retcode, 'stdout': output, 'stderr': ''}
+
+
+def _run_many(func, hosts_creds, max_workers=32, **kwargs):
+    '''
+    Run ``func`` against several chassis concurrently.
+
+    ``hosts_creds`` is an iterable of (host, admin_username,
+    admin_password) tuples; the return value is a dict keyed on host.
+    Failures on one host are recorded in its result instead of
+    aborting the whole fan-out.
+    '''
+    hosts_creds = list(hosts_creds)
+
+    def _one(creds):
+        host, admin_username, admin_password = creds
+        try:
+            return func(host=host, admin_username=admin_username,
+                        admin_password=admin_password, **kwargs)
+        except Exception as exc:  # pylint: disable=broad-except
+            log.error('dracr call against {0} failed: {1}'
+                      .format(host, exc))
+            return {'retcode': -1, 'stdout': str(exc)}
+
+    results = _parallel_map(_one, hosts_creds, max_workers=max_workers)
+
+    ret = {}
+    for creds, result in zip(hosts_creds, results):
+        ret[creds[0]] = result
+    return ret
+
+
+def _invalidate_users_cache(host=None):
+    '''
+    Drop any memoized list_users results for ``host``
+    '''
+    for key in list(_users_cache):
+        if key[0] == host:
+            del _users_cache[key]
+
+
+def _invalidate_slotnames_cache(host=None):
+    '''
+    Drop any memoized list_slotnames results for ``host``
+    '''
+    for key in list(_slotnames_cache):
+        if key[0] == host:
+            del _slotnames_cache[key]
+
+
+def _invalidate_sysinfo_cache(host=None):
+    '''
+    Drop any memoized system_info results for ``host``
+    '''
+    for key in list(_sysinfo_cache):
+        if key[0] == host:
+            del _sysinfo_cache[key]
+
+
 def __virtual__():
-    if salt.utils.which('racadm'):
+    global _racadm_path
+    if _racadm_path is None:
+        _racadm_path = salt.utils.which('racadm') or False
+    if _racadm_path:
         return True
 
     return (False, 'The drac execution module cannot be loaded: racadm binary not in path.')
@@ -47,19 +407,25 @@ def __parse_drac(output):
     drac = {}
     section = ''
 
-    for i in output.splitlines():
-        if i.strip().endswith(':') and '=' not in i:
-            section = i[0:-1]
-            drac[section] = {}
-        if len(i.rstrip()) > 0 and '=' in i:
-            if section in drac:
-                drac[section].update(dict(
-                    [[prop.strip() for prop in i.split('=')]]
-                ))
-            else:
-                section = i.strip()
-                if section not in drac and section:
-                    drac[section] = {}
+    for line in _iter_lines(output):
+        line = line.strip()
+        if not line:
+            continue
+        if line[0] == '[' and line[-1] == ']':
+            # 'racadm get' opens each group with a bracketed
+            # [Key=...] line instead of a 'Section:' header; the whole
+            # line, brackets included, is the section name consumers
+            # such as the dellchassis state look entries up under
+            section = line
+            if section not in drac:
+                drac[section] = {}
+        elif '=' in line:
+            key, _, val = line.partition('=')
+            drac.setdefault(section, {})[key.strip()] = val.strip()
+        elif line.endswith(':'):
+            section = line[:-1].strip()
+            if section not in drac:
+                drac[section] = {}
 
     return drac
 
@@ -81,18 +447,24 @@ def __execute_cmd(command, host=None,
             modswitch = '-m {0}'.format(module)
     else:
         modswitch = ''
+    cmd = None
     if not host:
         # This is a local call
-        cmd = __salt__['cmd.run_all']('racadm {0} {1}'.format(command,
-                                                              modswitch))
+        cmd = __salt__['cmd.run_all']((_racadm_path or 'racadm')
+                                      + ' ' + command + ' ' + modswitch)
     else:
-        cmd = __salt__['cmd.run_all'](
-            'racadm -r {0} -u {1} -p {2} {3} {4}'.format(host,
+        if _ssh_sessions_enabled():
+            cmd = _execute_over_ssh('{0} {1}'.format(command, modswitch),
+                                    host, admin_username, admin_password)
+        if cmd is None:
+            cmd = __salt__['cmd.run_all'](
+                (_racadm_path or 'racadm')
+                + ' -r {0} -u {1} -p {2} {3} {4}'.format(host,
                                                          admin_username,
                                                          admin_password,
                                                          command,
                                                          modswitch),
-        output_loglevel='quiet')
+                output_loglevel='quiet')
 
     if cmd['retcode'] != 0:
         log.warning('racadm return an exit code \'{0}\'.'
@@ -104,9 +476,13 @@ def __execute_cmd(command, host=None,
 
 def __execute_ret(command, host=None,
                   admin_username=None, admin_password=None,
-                  module=None):
+                  module=None, quiet=False):
     '''
     Execute rac commands
+
+    Pass ``quiet=True`` when a non-zero exit is expected and handled
+    by the caller; the failure is then logged at debug instead of
+    warning.
     '''
     if module:
         if module == 'ALL':
@@ -115,44 +491,118 @@ def __execute_ret(command, host=None,
             modswitch = '-m {0}'.format(module)
     else:
         modswitch = ''
+    cmd = None
     if not host:
         # This is a local call
-        cmd = __salt__['cmd.run_all']('racadm {0} {1}'.format(command,
-                                                              modswitch))
+        cmd = __salt__['cmd.run_all']((_racadm_path or 'racadm')
+                                      + ' ' + command + ' ' + modswitch)
     else:
-        cmd = __salt__['cmd.run_all'](
-            'racadm -r {0} -u {1} -p {2} {3} {4}'.format(host,
+        if _ssh_sessions_enabled():
+            cmd = _execute_over_ssh('{0} {1}'.format(command, modswitch),
+                                    host, admin_username, admin_password)
+        if cmd is None:
+            cmd = __salt__['cmd.run_all'](
+                (_racadm_path or 'racadm')
+                + ' -r {0} -u {1} -p {2} {3} {4}'.format(host,
                                                          admin_username,
                                                          admin_password,
                                                          command,
                                                          modswitch),
-        output_loglevel='quiet')
+                output_loglevel='quiet')
 
     if cmd['retcode'] != 0:
-        log.warning('racadm return an exit code \'{0}\'.'
-                    .format(cmd['retcode']))
+        if quiet:
+            log.debug('racadm return an exit code \'{0}\'.'
+                      .format(cmd['retcode']))
+        else:
+            log.warning('racadm return an exit code \'{0}\'.'
+                        .format(cmd['retcode']))
     else:
         fmtlines = []
-        for l in cmd['stdout'].splitlines():
-            if l.startswith('Security Alert'):
-                continue
-            if l.startswith('RAC1168:'):
+        for l in _iter_lines(cmd['stdout']):
+            if l.startswith(_STOP_PREFIXES):
                 break
-            if l.startswith('RAC1169:'):
-                break
-            if l.startswith('Continuing execution'):
-                continue
-
-            if len(l.strip()) == 0:
+            if not l.strip() or l.startswith(_SKIP_PREFIXES):
                 continue
             fmtlines.append(l)
-            if '=' in l:
-                continue
         cmd['stdout'] = '\n'.join(fmtlines)
 
     return cmd
 
 
+def __execute_batch(commands, host=None,
+                    admin_username=None, admin_password=None,
+                    module=None):
+    '''
+    Execute a sequence of rac commands in a single shell invocation
+
+    The individual racadm invocations are joined with ``&&`` so one
+    subprocess (and one remote session when ``host`` is passed) covers
+    the whole sequence and the first failing command aborts the rest.
+    '''
+    if not commands:
+        return True
+
+    if module:
+        # -a takes 'server' or 'switch' to represent all servers
+        # or all switches in a chassis.  Allow
+        # user to say 'module=ALL_SERVER' or 'module=ALL_SWITCH'
+        if module.startswith('ALL_'):
+            modswitch = '-a '\
+                        + module[module.index('_') + 1:len(module)].lower()
+        else:
+            modswitch = '-m {0}'.format(module)
+    else:
+        modswitch = ''
+
+    if host and _ssh_sessions_enabled():
+        for i, command in enumerate(commands):
+            cmd = _execute_over_ssh(command + ' ' + modswitch,
+                                    host, admin_username, admin_password)
+            if cmd is None:
+                if i == 0:
+                    # No session to be had; use the one-shot batch
+                    break
+                # The session died part-way through; don't re-run the
+                # commands that already succeeded
+                log.warning('SSH session lost part-way through a '
+                            'racadm batch')
+                return False
+            if cmd['retcode'] != 0:
+                log.warning('racadm return an exit code \'{0}\'.'
+                            .format(cmd['retcode']))
+                return False
+        else:
+            return True
+
+    racadm_cmds = []
+    for command in commands:
+        if not host:
+            racadm_cmds.append((_racadm_path or 'racadm')
+                               + ' ' + command + ' ' + modswitch)
+        else:
+            racadm_cmds.append((_racadm_path or 'racadm')
+                               + ' -r {0} -u {1} -p {2} {3} {4}'
+                               .format(host, admin_username, admin_password,
+                                       command, modswitch))
+
+    if not host:
+        # This is a local call
+        cmd = __salt__['cmd.run_all'](' && '.join(racadm_cmds),
+                                      python_shell=True)
+    else:
+        cmd = __salt__['cmd.run_all'](' && '.join(racadm_cmds),
+                                      python_shell=True,
+                                      output_loglevel='quiet')
+
+    if cmd['retcode'] != 0:
+        log.warning('racadm return an exit code \'{0}\'.'
+                    .format(cmd['retcode']))
+        return False
+
+    return True
+
+
 def get_dns_dracname(host=None,
                      admin_username=None, admin_password=None):
 
@@ -200,6 +650,26 @@ def system_info(host=None,
     return __parse_drac(cmd['stdout'])
 
 
+def system_info_many(hosts_creds, module=None, max_workers=32):
+    '''
+    Return system information for several chassis at once.
+
+    hosts_creds
+        A list of (host, admin_username, admin_password) tuples.  The
+        hosts are queried concurrently and the results returned as a
+        dict keyed on host.
+
+    CLI Example:
+
+    .. code-block:: bash
+
+        salt dell dracr.system_info_many \\
+            "[['192.168.0.100', 'root', 'calvin']]"
+    '''
+    return _run_many(system_info, hosts_creds, max_workers=max_workers,
+                     module=module)
+
+
 def set_niccfg(ip=None, netmask=None, gateway=None, dhcp=False,
                host=None,
                admin_username=None,
@@ -301,16 +771,13 @@ def nameservers(ns,
         log.warning('racadm only supports two nameservers')
         return False
 
-    for i in range(1, len(ns) + 1):
-        if not __execute_cmd('config -g cfgLanNetworking -o '
-                             'cfgDNSServer{0} {1}'.format(i, ns[i - 1]),
-                             host=host,
-                             admin_username=admin_username,
-                             admin_password=admin_password,
-                             module=module):
-            return False
-
-    return True
+    return __execute_batch(['config -g cfgLanNetworking -o '
+                            'cfgDNSServer{0} {1}'.format(i + 1, server)
+                            for i, server in enumerate(ns)],
+                           host=host,
+                           admin_username=admin_username,
+                           admin_password=admin_password,
+                           module=module)
 
 
 def syslog(server, enable=True, host=None,
@@ -327,12 +794,25 @@ def syslog(server, enable=True, host=None,
         salt dell dracr.syslog [SYSLOG IP] [ENABLE/DISABLE]
         salt dell dracr.syslog 0.0.0.0 False
     '''
-    if enable and __execute_cmd('config -g cfgRemoteHosts -o '
-                                'cfgRhostsSyslogEnable 1',
-                                host=host,
-                                admin_username=admin_username,
-                                admin_password=admin_password,
-                                module=None):
+    if enable:
+        if module is None:
+            return __execute_batch(['config -g cfgRemoteHosts -o '
+                                    'cfgRhostsSyslogEnable 1',
+                                    'config -g cfgRemoteHosts -o '
+                                    'cfgRhostsSyslogServer1 {0}'.format(server)],
+                                   host=host,
+                                   admin_username=admin_username,
+                                   admin_password=admin_password)
+        # The enable flag always targets the chassis; only the syslog
+        # server setting takes the -m switch, so these two can't share
+        # a batch
+        if not __execute_cmd('config -g cfgRemoteHosts -o '
+                             'cfgRhostsSyslogEnable 1',
+                             host=host,
+                             admin_username=admin_username,
+                             admin_password=admin_password,
+                             module=None):
+            return False
         return __execute_cmd('config -g cfgRemoteHosts -o '
                              'cfgRhostsSyslogServer1 {0}'.format(server),
                              host=host,
@@ -375,9 +855,11 @@ def email_alerts(action,
 def list_users(host=None,
                admin_username=None,
                admin_password=None,
-               module=None):
+               module=None,
+               parallel=True):
     '''
-    List all DRAC users
+    List all DRAC users.  Pass ``parallel=False`` to query the sixteen
+    user slots one at a time instead of concurrently.
 
     CLI Example:
 
@@ -385,19 +867,72 @@ def list_users(host=None,
 
         salt dell dracr.list_users
     '''
+    cache_key = (host, admin_username, module)
+    cached = _users_cache.get(cache_key)
+    if cached is not None and time.time() - cached[0] < _USERS_CACHE_TTL:
+        return cached[1]
+
     users = {}
     _username = ''
 
-    for idx in range(1, 17):
-        cmd = __execute_ret('getconfig -g '
-                            'cfgUserAdmin -i {0}'.format(idx),
+    # Newer firmware dumps every index from one getconfig call; fall
+    # back to one call per index when the aggregate form is rejected.
+    # The probe is quiet because a miss is expected and handled, and
+    # hosts already known to reject it skip the probe entirely.
+    aggregate_key = (host, admin_username)
+    cmd = None
+    if aggregate_key not in _users_aggregate_unsupported:
+        cmd = __execute_ret('getconfig -g cfgUserAdmin',
                             host=host, admin_username=admin_username,
-                            admin_password=admin_password)
+                            admin_password=admin_password,
+                            quiet=True)
+
+    if cmd is not None and cmd['retcode'] == 0:
+        idx = 0
+        for user in cmd['stdout'].splitlines():
+            user = user.strip()
+            if 'cfgUserAdminIndex=' in user:
+                try:
+                    idx = int(user.split('=')[1])
+                except ValueError:
+                    idx = 0
+                _username = ''
+                continue
+
+            if not user.startswith('cfg'):
+                continue
+
+            (key, val) = user.split('=')
+
+            if key.startswith('cfgUserAdminUserName'):
+                _username = val.strip()
 
+                if val:
+                    users[_username] = {'index': idx}
+            else:
+                if len(_username) > 0:
+                    users[_username].update({key: val})
+
+        _users_cache[cache_key] = (time.time(), users)
+        return users
+
+    def _fetch_slot(idx):
+        return __execute_ret('getconfig -g cfgUserAdmin -i ' + str(idx),
+                             host=host, admin_username=admin_username,
+                             admin_password=admin_password)
+
+    # Error results are never cached; a failed fetch would otherwise
+    # poison the cache with a missing or truncated user list for the
+    # whole TTL
+    fetch_failed = [False]
+
+    def _parse_slot(idx, cmd):
         if cmd['retcode'] != 0:
             log.warning('racadm return an exit code \'{0}\'.'
                         .format(cmd['retcode']))
+            fetch_failed[0] = True
 
+        _username = ''
         for user in cmd['stdout'].splitlines():
             if not user.startswith('cfg'):
                 continue
@@ -414,7 +949,41 @@ def list_users(host=None,
             else:
                 if len(_username) > 0:
                     users[_username].update({key: val})
+        return _username
+
+    if parallel:
+        # Eight workers keeps concurrent sessions under OpenSSH's
+        # default MaxStartups limit on the DRAC
+        slot_cmds = _parallel_map(_fetch_slot, list(range(1, 17)),
+                                  max_workers=8)
+        for idx, cmd in enumerate(slot_cmds, 1):
+            _parse_slot(idx, cmd)
+    else:
+        # Most DRACs only populate the first few slots, so stop
+        # probing once two consecutive slots past the well-known
+        # admin slots come back empty
+        consecutive_empty = 0
+        for idx in range(1, 17):
+            cmd = _fetch_slot(idx)
+            # A failed fetch says nothing about whether the slot is
+            # empty, so it never counts toward the short-circuit
+            if _parse_slot(idx, cmd) or cmd['retcode'] != 0:
+                consecutive_empty = 0
+            else:
+                consecutive_empty += 1
+                if idx > 2 and consecutive_empty >= 2:
+                    break
 
+    if not fetch_failed[0]:
+        if cmd is not None:
+            # The per-index form works while the aggregate probe was
+            # rejected, so this really is a firmware limitation and
+            # not a transient failure; remember it so the probe isn't
+            # re-paid after every cache expiry
+            log.debug('aggregate cfgUserAdmin getconfig unsupported '
+                      'on {0}; using per-index queries'.format(host))
+            _users_aggregate_unsupported.add(aggregate_key)
+        _users_cache[cache_key] = (time.time(), users)
     return users
 
 
@@ -438,10 +1007,13 @@ def delete_user(username,
         uid = user[username]['index']
 
     if uid:
-        return __execute_cmd('config -g cfgUserAdmin -o '
-                             'cfgUserAdminUserName -i {0} ""'.format(uid),
-                             host=host, admin_username=admin_username,
-                             admin_password=admin_password)
+        ret = __execute_cmd('config -g cfgUserAdmin -o '
+                            'cfgUserAdminUserName -i {0} ""'.format(uid),
+                            host=host, admin_username=admin_username,
+                            admin_password=admin_password)
+        if ret:
+            _invalidate_users_cache(host)
+        return ret
 
     else:
         log.warning('\'{0}\' does not exist'.format(username))
@@ -479,11 +1051,14 @@ def change_password(username, password, uid=None, host=None,
         uid = user[username]['index']
 
     if uid:
-        return __execute_cmd('config -g cfgUserAdmin -o '
-                             'cfgUserAdminPassword -i {0} {1}'
-                             .format(uid, password),
-                             host=host, admin_username=admin_username,
-                             admin_password=admin_password, module=module)
+        ret = __execute_cmd('config -g cfgUserAdmin -o '
+                            'cfgUserAdminPassword -i {0} {1}'
+                            .format(uid, password),
+                            host=host, admin_username=admin_username,
+                            admin_password=admin_password, module=module)
+        if ret:
+            _invalidate_users_cache(host)
+        return ret
     else:
         log.warning('\'{0}\' does not exist'.format(username))
         return False
@@ -561,48 +1136,53 @@ def create_user(username, password, permissions,
       * test_alerts             : Test Alerts
       * debug_commands          : Execute Debug Commands
     '''
-    _uids = set()
-
     if users is None:
-        users = list_users()
+        users = list_users(host=host, admin_username=admin_username,
+                           admin_password=admin_password)
 
     if username in users:
         log.warning('\'{0}\' already exists'.format(username))
         return False
 
-    for idx in six.iterkeys(users):
-        _uids.add(users[idx]['index'])
-
-    uid = sorted(list(set(range(2, 12)) - _uids), reverse=True).pop()
+    _uids = set(users[idx]['index'] for idx in six.iterkeys(users))
 
-    # Create user account first
-    if not __execute_cmd('config -g cfgUserAdmin -o '
-                         'cfgUserAdminUserName -i {0} {1}'
-                                 .format(uid, username),
-                         host=host, admin_username=admin_username,
-                         admin_password=admin_password):
-        delete_user(username, uid)
+    uid = next((u for u in range(2, 12) if u not in _uids), None)
+    if uid is None:
+        log.warning('all DRAC user slots are in use')
         return False
 
-    # Configure users permissions
-    if not set_permissions(username, permissions, uid):
-        log.warning('unable to set user permissions')
-        delete_user(username, uid)
+    # Create the account, permissions, password and enable flag in one
+    # racadm session instead of four
+    if not __execute_batch(['config -g cfgUserAdmin -o '
+                            'cfgUserAdminUserName -i {0} {1}'
+                            .format(uid, username),
+                            'config -g cfgUserAdmin -o '
+                            'cfgUserAdminPrivilege -i {0} 0x{1:08X}'
+                            .format(uid, __parse_privileges(permissions)),
+                            'config -g cfgUserAdmin -o '
+                            'cfgUserAdminPassword -i {0} {1}'
+                            .format(uid, password),
+                            'config -g cfgUserAdmin -o '
+                            'cfgUserAdminEnable -i {0} 1'.format(uid)],
+                           host=host, admin_username=admin_username,
+                           admin_password=admin_password):
+        log.warning('unable to create user \'{0}\''.format(username))
+        delete_user(username, uid, host=host,
+                    admin_username=admin_username,
+                    admin_password=admin_password)
         return False
 
-    # Configure users password
-    if not change_password(username, password, uid):
-        log.warning('unable to set user password')
-        delete_user(username, uid)
-        return False
+    _invalidate_users_cache(host)
+    return True
 
-    # Enable users admin
-    if not __execute_cmd('config -g cfgUserAdmin -o '
-                         'cfgUserAdminEnable -i {0} 1'.format(uid)):
-        delete_user(username, uid)
-        return False
 
-    return True
+def __parse_privileges(permissions):
+    '''
+    Turn a comma-separated list of DRAC privilege names into the
+    privilege bit mask racadm expects
+    '''
+    return sum(_PRIVILEGES.get(perm.strip(), 0)
+               for perm in permissions.split(','))
 
 
 def set_permissions(username, permissions,
@@ -630,29 +1210,13 @@ def set_permissions(username, permissions,
       * test_alerts             : Test Alerts
       * debug_commands          : Execute Debug Commands
     '''
-    privileges = {'login': '0x0000001',
-                  'drac': '0x0000002',
-                  'user_management': '0x0000004',
-                  'clear_logs': '0x0000008',
-                  'server_control_commands': '0x0000010',
-                  'console_redirection': '0x0000020',
-                  'virtual_media': '0x0000040',
-                  'test_alerts': '0x0000080',
-                  'debug_commands': '0x0000100'}
-
-    permission = 0
-
     # When users don't provide a user ID we need to search for this
     if uid is None:
         user = list_users()
         uid = user[username]['index']
 
     # Generate privilege bit mask
-    for i in permissions.split(','):
-        perm = i.strip()
-
-        if perm in privileges:
-            permission += int(privileges[perm], 16)
+    permission = __parse_privileges(permissions)
 
     return __execute_cmd('config -g cfgUserAdmin -o '
                          'cfgUserAdminPrivilege -i {0} 0x{1:08X}'
@@ -735,6 +1299,30 @@ def server_power(status, host=None,
                          admin_password=admin_password, module=module)
 
 
+def server_power_many(status, hosts_creds, module=None, max_workers=32):
+    '''
+    Run a power operation against several chassis at once.
+
+    status
+        One of 'powerup', 'powerdown', 'powercycle', 'hardreset',
+        'graceshutdown'
+
+    hosts_creds
+        A list of (host, admin_username, admin_password) tuples.  The
+        hosts are driven concurrently and the results returned as a
+        dict keyed on host.
+
+    CLI Example:
+
+    .. code-block:: bash
+
+        salt dell dracr.server_power_many powerdown \\
+            "[['192.168.0.100', 'root', 'calvin']]"
+    '''
+    return _run_many(server_power, hosts_creds, max_workers=max_workers,
+                     status=status, module=module)
+
+
 def server_reboot(host=None,
                   admin_username=None,
                   admin_password=None,
@@ -890,10 +1478,10 @@ def server_powerstatus(host=None,
     if ret['stdout'] == 'ON':
         result['status'] = True
         result['comment'] = 'Power is on'
-    if ret['stdout'] == 'OFF':
+    elif ret['stdout'] == 'OFF':
         result['status'] = False
-        result['comment'] = 'Power is on'
-    if ret['stdout'].startswith('ERROR'):
+        result['comment'] = 'Power is off'
+    elif ret['stdout'].startswith('ERROR'):
         result['status'] = False
         result['comment'] = ret['stdout']
 
@@ -912,18 +1500,17 @@ def server_pxe(host=None,
 
         salt dell dracr.server_pxe
     '''
-    if __execute_cmd('config -g cfgServerInfo -o cfgServerFirstBootDevice PXE',
-                     host=host, admin_username=admin_username,
-                     admin_password=admin_password):
-        if __execute_cmd('config -g cfgServerInfo -o cfgServerBootOnce 1',
-                         host=host, admin_username=admin_username,
-                         admin_password=admin_password):
-            return server_reboot
-        else:
-            log.warning('failed to set boot order')
-            return False
+    # One racadm session covers the boot-device config, the boot-once
+    # flag and the reboot; the first failing step aborts the rest
+    if __execute_batch(['config -g cfgServerInfo -o '
+                        'cfgServerFirstBootDevice PXE',
+                        'config -g cfgServerInfo -o cfgServerBootOnce 1',
+                        'serveraction powercycle'],
+                       host=host, admin_username=admin_username,
+                       admin_password=admin_password):
+        return True
 
-    log.warning('failed to to configure PXE boot')
+    log.warning('failed to configure PXE boot')
     return False
 
 
@@ -950,6 +1537,11 @@ def list_slotnames(host=None,
             admin_username=root admin_password=secret
 
     '''
+    cache_key = (host, admin_username)
+    cached = _slotnames_cache.get(cache_key)
+    if cached is not None and time.time() - cached[0] < _SLOTNAMES_CACHE_TTL:
+        return cached[1]
+
     slotraw = __execute_ret('getslotname',
                             host=host, admin_username=admin_username,
                             admin_password=admin_password)
@@ -958,24 +1550,22 @@ def list_slotnames(host=None,
         return slotraw
     slots = {}
     stripheader = True
-    for l in slotraw['stdout'].splitlines():
+    slot_match = _SLOT_RE.match
+    for l in _iter_lines(slotraw['stdout']):
         if l.startswith('<'):
             stripheader = False
             continue
         if stripheader:
             continue
-        fields = l.split()
-        slots[fields[0]] = {}
-        slots[fields[0]]['slot'] = fields[0]
-        if len(fields) > 1:
-            slots[fields[0]]['slotname'] = fields[1]
-        else:
-            slots[fields[0]]['slotname'] = ''
-        if len(fields) > 2:
-            slots[fields[0]]['hostname'] = fields[2]
-        else:
-            slots[fields[0]]['hostname'] = ''
+        match = slot_match(l)
+        if not match:
+            continue
+        slot, slotname, hostname = match.groups()
+        slots[slot] = {'slot': slot,
+                       'slotname': slotname or '',
+                       'hostname': hostname or ''}
 
+    _slotnames_cache[cache_key] = (time.time(), slots)
     return slots
 
 
@@ -1039,9 +1629,12 @@ def set_slotname(slot, name, host=None,
             admin_username=root admin_password=secret
 
     '''
-    return __execute_cmd('config -g cfgServerInfo -o cfgServerName -i {0} {1}'.format(slot, name),
-                         host=host, admin_username=admin_username,
-                         admin_password=admin_password)
+    ret = __execute_cmd('config -g cfgServerInfo -o cfgServerName -i {0} {1}'.format(slot, name),
+                        host=host, admin_username=admin_username,
+                        admin_password=admin_password)
+    if ret:
+        _invalidate_slotnames_cache(host)
+    return ret
 
 
 def set_chassis_name(name,
@@ -1071,9 +1664,13 @@ def set_chassis_name(name,
             admin_username=root admin_password=secret
 
     '''
-    return __execute_cmd('setsysinfo -c chassisname {0}'.format(name),
-                         host=host, admin_username=admin_username,
-                         admin_password=admin_password)
+    ret = __execute_cmd('setsysinfo -c chassisname {0}'.format(name),
+                        host=host, admin_username=admin_username,
+                        admin_password=admin_password)
+    if ret:
+        _invalidate_slotnames_cache(host)
+        _invalidate_sysinfo_cache(host)
+    return ret
 
 
 def get_chassis_name(host=None, admin_username=None, admin_password=None):
@@ -1102,17 +1699,45 @@ def get_chassis_name(host=None, admin_username=None, admin_password=None):
                         admin_password=admin_password)
 
 
-def inventory(host=None, admin_username=None, admin_password=None):
-    def mapit(x, y):
-        return {x: y}
+def _parse_inventory(output):
+    '''
+    Parse plain-text getversion output into the inventory dict
+    '''
+    ret = {'server': {}, 'switch': {}, 'cmc': {}, 'chassis': {}}
+
+    # Bind the names resolved on every iteration to locals; inside the
+    # loop they become fast local loads instead of global/attribute
+    # lookups
+    section_of = _INVENTORY_SECTIONS.get
+    fields_of = _INVENTORY_FIELDS
+    split_fields = _split_fields
+
+    # Point straight at the section's target dict and field names so
+    # data lines take a single branch instead of a four-way cascade
+    current_dict = None
+    current_fields = None
+    for l in _iter_lines(output):
+        if not l:
+            continue
+
+        # The empty-line check above guarantees l[0] exists; a plain
+        # character compare is cheaper than startswith for one char
+        if l[0] == '<':
+            section = section_of(l.split('>', 1)[0] + '>')
+            if section is not None:
+                current_dict = ret[section]
+                current_fields = fields_of[section]
+                continue
 
-    fields = {}
-    fields['server'] = ['name', 'idrac_version', 'blade_type', 'gen',
-                        'updateable']
-    fields['switch'] = ['name', 'model_name', 'hw_version', 'fw_version']
-    fields['cmc'] = ['name', 'cmc_version', 'updateable']
-    fields['chassis'] = ['name', 'fw_version', 'fqdd']
+        line = split_fields(l)
 
+        if current_dict is not None:
+            current_dict[line[0]] = dict(zip(current_fields, line))
+
+    return ret
+
+
+def inventory(host=None, admin_username=None, admin_password=None):
     rawinv = __execute_ret('getversion', host=host,
                            admin_username=admin_username,
                            admin_password=admin_password)
@@ -1120,67 +1745,26 @@ def inventory(host=None, admin_username=None, admin_password=None):
     if rawinv['retcode'] != 0:
         return rawinv
 
-    in_server = False
-    in_switch = False
-    in_cmc = False
-    in_chassis = False
-    ret = {}
-    ret['server'] = {}
-    ret['switch'] = {}
-    ret['cmc'] = {}
-    ret['chassis'] = {}
-    for l in rawinv['stdout'].splitlines():
-        if l.startswith('<Server>'):
-            in_server = True
-            in_switch = False
-            in_cmc = False
-            in_chassis = False
-            continue
+    return _parse_inventory(rawinv['stdout'])
 
-        if l.startswith('<Switch>'):
-            in_server = False
-            in_switch = True
-            in_cmc = False
-            in_chassis = False
-            continue
 
-        if l.startswith('<CMC>'):
-            in_server = False
-            in_switch = False
-            in_cmc = True
-            in_chassis = False
-            continue
+def inventory_many(hosts_creds, max_workers=32):
+    '''
+    Gather the inventory of several chassis at once.
 
-        if l.startswith('<Chassis Infrastructure>'):
-            in_server = False
-            in_switch = False
-            in_cmc = False
-            in_chassis = True
-            continue
+    hosts_creds
+        A list of (host, admin_username, admin_password) tuples.  The
+        hosts are queried concurrently and the results returned as a
+        dict keyed on host.
 
-        if len(l) < 1:
-            continue
+    CLI Example:
 
-        line = re.split('  +', l.strip())
-
-        if in_server:
-            ret['server'][line[0]] = dict(
-                (k, v) for d in map(mapit, fields['server'], line) for (k, v)
-                in d.items())
-        if in_switch:
-            ret['switch'][line[0]] = dict(
-                (k, v) for d in map(mapit, fields['switch'], line) for (k, v)
-                in d.items())
-        if in_cmc:
-            ret['cmc'][line[0]] = dict(
-                (k, v) for d in map(mapit, fields['cmc'], line) for (k, v) in
-                d.items())
-        if in_chassis:
-            ret['chassis'][line[0]] = dict(
-                (k, v) for d in map(mapit, fields['chassis'], line) for k, v in
-                d.items())
+    .. code-block:: bash
 
-    return ret
+        salt dell dracr.inventory_many \\
+            "[['192.168.0.100', 'root', 'calvin']]"
+    '''
+    return _run_many(inventory, hosts_creds, max_workers=max_workers)
 
 
 def set_chassis_location(location,
@@ -1210,9 +1794,31 @@ def set_chassis_location(location,
             admin_username=root admin_password=secret
 
     '''
-    return __execute_cmd('setsysinfo -c chassislocation {0}'.format(location),
-                         host=host, admin_username=admin_username,
-                         admin_password=admin_password)
+    ret = __execute_cmd('setsysinfo -c chassislocation {0}'.format(location),
+                        host=host, admin_username=admin_username,
+                        admin_password=admin_password)
+    if ret:
+        _invalidate_sysinfo_cache(host)
+    return ret
+
+
+def _system_info_cached(host=None, admin_username=None,
+                        admin_password=None):
+    '''
+    system_info with a short per-host memo, for accessors that only
+    pick one value out of the full getsysinfo dump.  Error results are
+    never cached.
+    '''
+    cache_key = (host, admin_username)
+    cached = _sysinfo_cache.get(cache_key)
+    if cached is not None and time.time() - cached[0] < _SYSINFO_CACHE_TTL:
+        return cached[1]
+
+    info = system_info(host=host, admin_username=admin_username,
+                       admin_password=admin_password)
+    if 'retcode' not in info:
+        _sysinfo_cache[cache_key] = (time.time(), info)
+    return info
 
 
 def get_chassis_location(host=None,
@@ -1238,9 +1844,9 @@ def get_chassis_location(host=None,
            admin_username=root admin_password=secret
 
     '''
-    return system_info(host=host,
-                       admin_username=admin_username,
-                       admin_password=admin_password)['Chassis Information']['Chassis Location']
+    return _system_info_cached(host=host,
+                               admin_username=admin_username,
+                               admin_password=admin_password)['Chassis Information']['Chassis Location']
 
 
 def set_chassis_datacenter(location,
@@ -1311,6 +1917,47 @@ def set_general(cfg_sec, cfg_var, val, host=None,
                          admin_password=admin_password)
 
 
+def set_general_batch(settings, host=None,
+                      admin_username=None, admin_password=None):
+    '''
+    Apply several config settings through one racadm session instead
+    of one session per setting.
+
+    settings
+        An iterable of (cfg_sec, cfg_var, val) tuples, applied in
+        order; the first failing setting aborts the rest.
+
+    CLI Example:
+
+    .. code-block:: bash
+
+        salt '*' dracr.set_general_batch \\
+            "[['cfgLocation', 'cfgLocationDatacenter', 'dc-1'],
+              ['cfgLocation', 'cfgLocationRack', '42']]" \\
+            host=111.222.333.444 admin_username=root admin_password=secret
+
+    '''
+    return __execute_batch(['config -g {0} -o {1} {2}'.format(cfg_sec,
+                                                              cfg_var, val)
+                            for cfg_sec, cfg_var, val in settings],
+                           host=host,
+                           admin_username=admin_username,
+                           admin_password=admin_password)
+
+
+def _stdout_or_ret(ret):
+    '''
+    Shared return contract for the generic racadm wrappers: the raw
+    stdout string on success, the full cmd.run_all dict on failure so
+    callers keep access to the retcode and stderr. Callers distinguish
+    the two by checking for a dict. Kept in one place so every wrapper
+    stays consistent.
+    '''
+    if ret['retcode'] == 0:
+        return ret['stdout']
+    return ret
+
+
 def get_general(cfg_sec, cfg_var, host=None,
                 admin_username=None, admin_password=None):
     ret = __execute_ret('getconfig -g {0} -o {1}'.format(cfg_sec, cfg_var),
@@ -1318,10 +1965,7 @@ def get_general(cfg_sec, cfg_var, host=None,
                         admin_username=admin_username,
                         admin_password=admin_password)
 
-    if ret['retcode'] == 0:
-        return ret['stdout']
-    else:
-        return ret
+    return _stdout_or_ret(ret)
 
 
 def idrac_general(blade_name, command, idrac_password=None,
@@ -1364,10 +2008,7 @@ def idrac_general(blade_name, command, idrac_password=None,
                         admin_username='root',
                         admin_password=password)
 
-    if ret['retcode'] == 0:
-        return ret['stdout']
-    else:
-        return ret
+    return _stdout_or_ret(ret)
 
 
 def _update_firmware(cmd,
@@ -1385,10 +2026,7 @@ def _update_firmware(cmd,
                         admin_username=admin_username,
                         admin_password=admin_password)
 
-    if ret['retcode'] == 0:
-        return ret['stdout']
-    else:
-        return ret
+    return _stdout_or_ret(ret)
 
 
 def bare_rac_cmd(cmd, host=None,
@@ -1398,10 +2036,7 @@ def bare_rac_cmd(cmd, host=None,
                         admin_username=admin_username,
                         admin_password=admin_password)
 
-    if ret['retcode'] == 0:
-        return ret['stdout']
-    else:
-        return ret
+    return _stdout_or_ret(ret)
 
 
 def update_firmware(filename,
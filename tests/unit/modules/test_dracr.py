@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+'''
+    Test cases for salt.modules.dracr
+'''
+
+# Import Python libs
+from __future__ import absolute_import
+
+# Import Salt Testing Libs
+from tests.support.mixins import LoaderModuleMockMixin
+from tests.support.unit import TestCase, skipIf
+from tests.support.mock import (
+    MagicMock,
+    patch,
+    NO_MOCK,
+    NO_MOCK_REASON
+)
+
+# Import Salt Libs
+import salt.modules.dracr as dracr
+
+
+@skipIf(NO_MOCK, NO_MOCK_REASON)
+class DracrTestCase(TestCase, LoaderModuleMockMixin):
+    '''
+    Test cases for salt.modules.dracr
+    '''
+    def setup_loader_modules(self):
+        return {dracr: {}}
+
+    def setUp(self):
+        dracr._users_cache.clear()
+        dracr._users_aggregate_unsupported.clear()
+
+    def tearDown(self):
+        dracr._users_cache.clear()
+        dracr._users_aggregate_unsupported.clear()
+
+    def test_parse_drac_sections(self):
+        '''
+        Tests parsing getsysinfo style output with 'Section:' headers
+        '''
+        output = '\n'.join(['System Information:',
+                            'System Model = PowerEdge M620',
+                            'System BIOS Version = 2.5.4',
+                            '',
+                            'RAC Information:',
+                            'RAC Date/Time = Thu Jan 21 2016'])
+        ret = getattr(dracr, '__parse_drac')(output)
+        self.assertEqual(ret['System Information']['System Model'],
+                         'PowerEdge M620')
+        self.assertEqual(ret['RAC Information']['RAC Date/Time'],
+                         'Thu Jan 21 2016')
+
+    def test_parse_drac_bracket_group(self):
+        '''
+        Tests that 'racadm get' bracketed [Key=...] lines become
+        section names verbatim; the dellchassis state looks values up
+        under the whole bracketed line
+        '''
+        output = '\n'.join(['[Key=iDRAC.Embedded.1#NIC.1]',
+                            'DNSRacName=idrac-1'])
+        ret = getattr(dracr, '__parse_drac')(output)
+        self.assertEqual(
+            ret['[Key=iDRAC.Embedded.1#NIC.1]']['DNSRacName'],
+            'idrac-1')
+
+    def test_parse_drac_keys_before_header(self):
+        '''
+        Tests that key=value lines before any section header are kept
+        instead of dropped
+        '''
+        output = '\n'.join(['Header = early',
+                            'Network:',
+                            'DHCP Enabled = 1'])
+        ret = getattr(dracr, '__parse_drac')(output)
+        self.assertEqual(ret['']['Header'], 'early')
+        self.assertEqual(ret['Network']['DHCP Enabled'], '1')
+
+    def test_split_fields(self):
+        '''
+        Tests that getversion rows split on runs of two or more spaces
+        while single spaces stay inside a field
+        '''
+        self.assertEqual(dracr._split_fields('a b  c   d  '),
+                         ['a b', 'c', 'd'])
+        self.assertEqual(dracr._split_fields('single'), ['single'])
+        self.assertEqual(dracr._split_fields(''), [])
+
+    def test_parse_inventory(self):
+        '''
+        Tests parsing a representative getversion dump, including a
+        multi-word switch model name
+        '''
+        output = '\n'.join(['<CMC>  <cmc version>  <updatable>',
+                            'cmc-1  5.12  Y',
+                            'cmc-2  5.12  N',
+                            '',
+                            '<Server>',
+                            'server-1   2.20.20.20  PowerEdgeM630  iDRAC8  Y',
+                            '',
+                            '<Switch>',
+                            'switch-1   Dell PowerConnect M8024-k   A02   5.1.8.2'])
+        ret = dracr._parse_inventory(output)
+        self.assertEqual(ret['cmc']['cmc-1'],
+                         {'name': 'cmc-1', 'cmc_version': '5.12',
+                          'updateable': 'Y'})
+        self.assertEqual(ret['server']['server-1'],
+                         {'name': 'server-1',
+                          'idrac_version': '2.20.20.20',
+                          'blade_type': 'PowerEdgeM630',
+                          'gen': 'iDRAC8',
+                          'updateable': 'Y'})
+        self.assertEqual(ret['switch']['switch-1']['model_name'],
+                         'Dell PowerConnect M8024-k')
+
+    def test_list_users_aggregate(self):
+        '''
+        Tests building the user list from one aggregate getconfig call
+        '''
+        stdout = '\n'.join(['# cfgUserAdminIndex=1',
+                            'cfgUserAdminUserName=root',
+                            'cfgUserAdminPrivilege=0x00000fff',
+                            '# cfgUserAdminIndex=2',
+                            'cfgUserAdminUserName='])
+        mock = MagicMock(return_value={'retcode': 0, 'stdout': stdout})
+        with patch.object(dracr, '__execute_ret', mock):
+            users = dracr.list_users()
+        self.assertEqual(users,
+                         {'root': {'index': 1,
+                                   'cfgUserAdminPrivilege': '0x00000fff'}})
+        self.assertEqual(mock.call_count, 1)
+
+    def test_list_users_fallback_short_circuit(self):
+        '''
+        Tests the per-index fallback when the aggregate form is
+        rejected, and that the serial scan stops after two consecutive
+        empty slots past the admin slots
+        '''
+        def racadm(command, **kwargs):
+            if command == 'getconfig -g cfgUserAdmin':
+                return {'retcode': 1, 'stdout': ''}
+            idx = int(command.rsplit(' ', 1)[-1])
+            names = {1: 'root', 2: 'admin'}
+            return {'retcode': 0,
+                    'stdout': 'cfgUserAdminUserName={0}'.format(
+                        names.get(idx, ''))}
+
+        mock = MagicMock(side_effect=racadm)
+        with patch.object(dracr, '__execute_ret', mock):
+            users = dracr.list_users(parallel=False)
+            self.assertEqual(users, {'root': {'index': 1},
+                                     'admin': {'index': 2}})
+            # One aggregate probe, then slots 1-4: 3 and 4 are the two
+            # consecutive empties that stop the scan
+            self.assertEqual(mock.call_count, 5)
+            # The rejected aggregate form is remembered and the result
+            # cached, so a second call issues no racadm commands
+            dracr.list_users(parallel=False)
+            self.assertEqual(mock.call_count, 5)
+
+    def test_list_users_failures_not_cached(self):
+        '''
+        Tests that an enumeration built from failed fetches is not
+        cached for the TTL
+        '''
+        mock = MagicMock(return_value={'retcode': 1, 'stdout': ''})
+        with patch.object(dracr, '__execute_ret', mock):
+            users = dracr.list_users(parallel=False)
+        self.assertEqual(users, {})
+        self.assertEqual(dracr._users_cache, {})
+        self.assertEqual(dracr._users_aggregate_unsupported, set())
+
+    def test_execute_batch(self):
+        '''
+        Tests joining a command batch into one shell invocation and
+        its success/failure returns
+        '''
+        batch = getattr(dracr, '__execute_batch')
+        commands = ['config -g cfgSerial -o cfgSerialTelnetEnable 1',
+                    'config -g cfgSerial -o cfgSerialSshEnable 1']
+
+        mock = MagicMock(return_value={'retcode': 0, 'stdout': ''})
+        with patch.dict(dracr.__salt__, {'cmd.run_all': mock}):
+            self.assertTrue(batch(commands))
+        self.assertEqual(mock.call_count, 1)
+        self.assertIn(' && ', mock.call_args[0][0])
+
+        mock = MagicMock(return_value={'retcode': 1, 'stdout': ''})
+        with patch.dict(dracr.__salt__, {'cmd.run_all': mock}):
+            self.assertFalse(batch(commands))
+
+        mock = MagicMock()
+        with patch.dict(dracr.__salt__, {'cmd.run_all': mock}):
+            self.assertTrue(batch([]))
+        self.assertEqual(mock.call_count, 0)